@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import os
 
 inputFile = 'input.csv'
@@ -6,22 +7,12 @@ if not os.path.exists(inputFile):
 	print('Cannot find '+ inputFile + '.')
 	quit()
 	
-input = open(inputFile,'r')
-
-x = []
-y = []
-
-#Read each line of the input file.
+#Read the whole input file in one call.
 #Storing the x-coordinates into x.
 #Storing the y-coordinates into y.
-line = input.readline()
-while line:
-	coordinates = line.split(',')
-	x.append(float(coordinates[0]))
-	y.append(float(coordinates[1]))
-	line = input.readline()
-
-input.close()
+points = np.loadtxt(inputFile, delimiter=',', dtype=np.float64, ndmin=2)
+x = points[:,0]
+y = points[:,1]
 
 
 #Adding the input points to the plot so we can visualize what the points look like.
@@ -30,34 +21,19 @@ plt.scatter(x,y)
 
 outputFile = 'output.txt'
 if os.path.exists(outputFile):
-	output = open(outputFile,'r')
-	
-	convexHullX = []
-	convexHullY = []
-	
 	#The output file should be a list of the indices of the points from the input file that are on the convex hull.
-	line = output.readline()
-	firstIndex = -1
-	while line:
-		p = int(line)
-		
-		#We have to remember the first point so the convex hull can "wrap around" at the end.
-		if firstIndex == -1:
-			firstIndex = p
-			
-		convexHullX.append(x[p])
-		convexHullY.append(y[p])
+	hull = np.loadtxt(outputFile, dtype=np.int64, ndmin=1)
+	
+	#An empty output file has no hull to draw.
+	if hull.size > 0:
+		#Adding the first point onto the end again so the convex hull can "wrap around" and close.
+		hull = np.append(hull, hull[0])
+		convexHullX = x[hull]
+		convexHullY = y[hull]
 		
-		line = output.readline()
-	output.close()
-	
-	#Adding the first point into the list again to complete the convex hull.
-	convexHullX.append(x[firstIndex])
-	convexHullY.append(y[firstIndex])
-	
-	#Adding the points of the convex hull to the plot.
-	#The plot() function connects the points together with line segments.
-	plt.plot(convexHullX,convexHullY)
+		#Adding the points of the convex hull to the plot.
+		#The plot() function connects the points together with line segments.
+		plt.plot(convexHullX,convexHullY)
 	
 else:
 	print("No output file detected.  Only showing the point set.")
@@ -6,6 +6,8 @@ University Project - Analysis of Algorithms
 
 import sys
 import csv
+import math
+import multiprocessing
 
 # For Python 2.7 compatibility
 try:
@@ -20,59 +22,79 @@ try:
 except ImportError:
     pass
 
-EPS = 1e-12
-
-class Point:
-    """2D point with original index."""
-    def __init__(self, x, y, idx):
-        self.x = float(x)
-        self.y = float(y)
-        self.idx = int(idx)
-    
-    def __repr__(self):
-        return "Point({}, {}, {})".format(self.x, self.y, self.idx)
-
-def orient(a, b, c):
-    """+1 if a->b->c CCW, -1 if CW, 0 if collinear (with EPS)."""
-    val = (b.x - a.x) * (c.y - a.y) - (b.y - a.y) * (c.x - a.x)
-    if val > +EPS: 
+try:
+    from math import isfinite
+except ImportError:
+    # Python 2.7 has isinf/isnan but no isfinite
+    def isfinite(v):
+        return not (math.isinf(v) or math.isnan(v))
+
+# Shewchuk's error bound for the floating-point orientation determinant:
+# if |det| exceeds this times (|detleft| + |detright|), its sign is exact
+CCW_ERRBOUND_A = (3.0 + 16.0 * 2.0 ** -53) * 2.0 ** -53
+
+# Relative slack for the octagon pre-filter: a point is only discarded when
+# it is inside every edge by far more than floating-point rounding could
+# account for, so the filter never drops a hull point
+FILTER_SLACK = 1e-12
+
+# Below this many points the worker start-up and pickling cost more than
+# the parallel speedup buys back
+PARALLEL_MIN_POINTS = 50000
+
+def orient_exact(ax, ay, bx, by, cx, cy):
+    """Exact orientation sign using integer arithmetic (slow path).
+
+    Every float is n / 2**k, so scaling all six coordinates to the largest
+    denominator gives integers whose determinant has the same sign.
+    """
+    (pax, qax), (pay, qay), (pbx, qbx), (pby, qby), (pcx, qcx), (pcy, qcy) = (
+        ax.as_integer_ratio(), ay.as_integer_ratio(), bx.as_integer_ratio(),
+        by.as_integer_ratio(), cx.as_integer_ratio(), cy.as_integer_ratio())
+    d = max(qax, qay, qbx, qby, qcx, qcy)
+    if d > 1:    # integral inputs (d == 1) need no scaling
+        pax, pay, pbx = pax * (d // qax), pay * (d // qay), pbx * (d // qbx)
+        pby, pcx, pcy = pby * (d // qby), pcx * (d // qcx), pcy * (d // qcy)
+    val = (pbx - pax) * (pcy - pay) - (pby - pay) * (pcx - pax)
+    return (val > 0) - (val < 0)
+
+def orient(xs, ys, a, b, c):
+    """+1 if a->b->c CCW, -1 if CW, 0 if collinear.
+
+    Adaptive: the floating-point determinant is used when it clears the
+    error bound, otherwise the sign is recomputed exactly.
+    """
+    detleft = (xs[b] - xs[a]) * (ys[c] - ys[a])
+    detright = (ys[b] - ys[a]) * (xs[c] - xs[a])
+    val = detleft - detright
+    errbound = CCW_ERRBOUND_A * (abs(detleft) + abs(detright))
+    if val > errbound:
         return +1
-    if val < -EPS: 
+    if val < -errbound:
         return -1
-    return 0
-
-def left_of(a, b, p):
-    return orient(a, b, p) > 0
-
-def right_of(a, b, p):
-    return orient(a, b, p) < 0
+    return orient_exact(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c])
 
 def index_rightmost(H):
-    """Find rightmost point in hull (max x, break ties with max y)."""
-    k = 0
-    for i in range(1, len(H)):
-        if (H[i].x > H[k].x) or (H[i].x == H[k].x and H[i].y > H[k].y):
-            k = i
-    return k
+    """Find rightmost point in hull (max x, break ties with max y).
+
+    Hull entries are positions in the (x, y)-sorted point lists, so the
+    lexicographic maximum is simply the largest position.
+    """
+    return H.index(max(H))
 
 def index_leftmost(H):
     """Find leftmost point in hull (min x, break ties with min y)."""
-    k = 0
-    for i in range(1, len(H)):
-        if (H[i].x < H[k].x) or (H[i].x == H[k].x and H[i].y < H[k].y):
-            k = i
-    return k
-
-def hull_base_case(arr, lo, hi):
-    """Return CCW hull for 1..3 points in arr[lo:hi] (sorted by x then y)."""
+    return H.index(min(H))
+
+def hull_base_case(xs, ys, lo, hi):
+    """Return CCW hull for 1..3 points lo..hi-1 (sorted by x then y)."""
     n = hi - lo
     if n == 1:
-        return [arr[lo]]
+        return [lo]
     if n == 2:
-        a, b = arr[lo], arr[lo+1]
-        return [a, b]
-    a, b, c = arr[lo], arr[lo+1], arr[lo+2]
-    o = orient(a, b, c)
+        return [lo, lo+1]
+    a, b, c = lo, lo+1, lo+2
+    o = orient(xs, ys, a, b, c)
     if o >= 0:    # CCW or collinear
         if o == 0:
             # keep extremes only (sorted by x then y; a & c are extremes)
@@ -81,159 +103,424 @@ def hull_base_case(arr, lo, hi):
     else:
         return [a, c, b]  # flip to CCW
 
-def upper_tangent(L, R):
-    """Find upper tangent between two CCW hulls L and R."""
-    i = index_rightmost(L)
-    j = index_leftmost(R)
+def with_extremes(H):
+    """Pair a hull with the indices of its leftmost and rightmost vertex."""
+    return H, index_leftmost(H), index_rightmost(H)
+
+def leaf_hulls(xs, ys, lo, hi):
+    """Yield (hull, lmost, rmost) for consecutive runs of 3 points in lo..hi-1.
+
+    Equivalent to hull_base_case() on each run, but the common 3-point case
+    is one inline orientation test and its extremes are known from the
+    sort order; only borderline (nearly collinear) runs and a final run of
+    1-2 points go through hull_base_case().
+    """
+    end = hi - (hi - lo) % 3
+    for a in range(lo, end, 3):
+        b, c = a + 1, a + 2
+        l = (xs[b] - xs[a]) * (ys[c] - ys[a])
+        r = (ys[b] - ys[a]) * (xs[c] - xs[a])
+        bound = CCW_ERRBOUND_A * (abs(l) + abs(r))
+        if l - r > bound:
+            yield [a, b, c], 0, 2
+        elif l - r < -bound:
+            yield [a, c, b], 0, 1
+        else:
+            yield with_extremes(hull_base_case(xs, ys, a, a + 3))
+    if end < hi:
+        yield with_extremes(hull_base_case(xs, ys, end, hi))
+
+def upper_tangent(xs, ys, L, R, i, j):
+    """Find upper tangent between two CCW hulls L and R.
+
+    The walk starts from L[i] and R[j], the rightmost vertex of L and the
+    leftmost vertex of R. An index steps on while its next vertex is on the
+    wrong side of the line L[i]-R[j], or on that line and farther from the
+    other hull (a lower position on L, a higher one on R), so collinear
+    tangent points end at the outermost vertex.
+
+    The orientation tests are written out inline (same filter as orient())
+    since this loop runs on every merge; only a determinant the filter
+    cannot settle, including a nan from overflow on huge coordinates, goes
+    to orient_exact().
+    """
     nL, nR = len(L), len(R)
 
-    changed = True
     # Safe bound: an endpoint can wrap at most once
-    for _ in range(nL + nR + 5):
-        if not changed:
-            break
-        changed = False
+    rounds = nL + nR + 5
+    j_settled = False
+    while True:
+        if not rounds:
+            raise RuntimeError("upper_tangent did not converge")
+        rounds -= 1
         # Move i forward while next L vertex is to the RIGHT of R[j] -> L[i]
-        while right_of(R[j], L[i], L[(i+1) % nL]):
-            i = (i + 1) % nL
-            changed = True
+        moved = False
+        a = R[j]
+        ax, ay = xs[a], ys[a]
+        while True:
+            i1 = i + 1
+            if i1 == nL:
+                i1 = 0
+            b, c = L[i], L[i1]
+            bx, by, cx, cy = xs[b], ys[b], xs[c], ys[c]
+            l = (bx - ax) * (cy - ay)
+            r = (by - ay) * (cx - ax)
+            bound = CCW_ERRBOUND_A * (abs(l) + abs(r))
+            det = l - r
+            if not det > bound:
+                o = -1 if det < -bound else orient_exact(ax, ay, bx, by, cx, cy)
+                if o < 0 or (o == 0 and c < b):
+                    i = i1
+                    moved = True
+                    continue
+            break
+        # R[j] was settled against this same L[i]
+        if j_settled and not moved:
+            break
         # Move j backward while previous R vertex is to the LEFT of L[i] -> R[j]
-        while left_of(L[i], R[j], R[(j-1) % nR]):
-            j = (j - 1) % nR
-            changed = True
-    else:
-        raise RuntimeError("upper_tangent did not converge")
+        moved = False
+        a = L[i]
+        ax, ay = xs[a], ys[a]
+        while True:
+            b, c = R[j], R[j-1]    # R[-1] wraps to the last vertex
+            bx, by, cx, cy = xs[b], ys[b], xs[c], ys[c]
+            l = (bx - ax) * (cy - ay)
+            r = (by - ay) * (cx - ax)
+            bound = CCW_ERRBOUND_A * (abs(l) + abs(r))
+            det = l - r
+            if not det < -bound:
+                o = 1 if det > bound else orient_exact(ax, ay, bx, by, cx, cy)
+                if o > 0 or (o == 0 and c > b):
+                    j = j - 1 if j else nR - 1
+                    moved = True
+                    continue
+            break
+        if not moved:
+            break
+        j_settled = True
     return i, j
 
-def lower_tangent(L, R):
-    """Find lower tangent between two CCW hulls L and R."""
-    i = index_rightmost(L)
-    j = index_leftmost(R)
+def lower_tangent(xs, ys, L, R, i, j):
+    """Find lower tangent between two CCW hulls L and R, starting from L[i], R[j].
+
+    Mirror image of upper_tangent(): i moves backward and j forward, with
+    the same collinear rule and the same inline filter.
+    """
     nL, nR = len(L), len(R)
 
-    changed = True
-    for _ in range(nL + nR + 5):
-        if not changed:
-            break
-        changed = False
+    rounds = nL + nR + 5
+    j_settled = False
+    while True:
+        if not rounds:
+            raise RuntimeError("lower_tangent did not converge")
+        rounds -= 1
         # Move i backward while previous L vertex is to the LEFT of R[j] -> L[i]
-        while left_of(R[j], L[i], L[(i-1) % nL]):
-            i = (i - 1) % nL
-            changed = True
+        moved = False
+        a = R[j]
+        ax, ay = xs[a], ys[a]
+        while True:
+            b, c = L[i], L[i-1]    # L[-1] wraps to the last vertex
+            bx, by, cx, cy = xs[b], ys[b], xs[c], ys[c]
+            l = (bx - ax) * (cy - ay)
+            r = (by - ay) * (cx - ax)
+            bound = CCW_ERRBOUND_A * (abs(l) + abs(r))
+            det = l - r
+            if not det < -bound:
+                o = 1 if det > bound else orient_exact(ax, ay, bx, by, cx, cy)
+                if o > 0 or (o == 0 and c < b):
+                    i = i - 1 if i else nL - 1
+                    moved = True
+                    continue
+            break
+        if j_settled and not moved:
+            break
         # Move j forward while next R vertex is to the RIGHT of L[i] -> R[j]
-        while right_of(L[i], R[j], R[(j+1) % nR]):
-            j = (j + 1) % nR
-            changed = True
-    else:
-        raise RuntimeError("lower_tangent did not converge")
+        moved = False
+        a = L[i]
+        ax, ay = xs[a], ys[a]
+        while True:
+            j1 = j + 1
+            if j1 == nR:
+                j1 = 0
+            b, c = R[j], R[j1]
+            bx, by, cx, cy = xs[b], ys[b], xs[c], ys[c]
+            l = (bx - ax) * (cy - ay)
+            r = (by - ay) * (cx - ax)
+            bound = CCW_ERRBOUND_A * (abs(l) + abs(r))
+            det = l - r
+            if not det > bound:
+                o = -1 if det < -bound else orient_exact(ax, ay, bx, by, cx, cy)
+                if o < 0 or (o == 0 and c > b):
+                    j = j1
+                    moved = True
+                    continue
+            break
+        if not moved:
+            break
+        j_settled = True
     return i, j
 
-def ensure_upper_tangent_valid(L, R, i, j):
+def ensure_upper_tangent_valid(xs, ys, L, R, i, j):
     """Validate upper tangent (enable during debugging)."""
     A, B = L[i], R[j]
-    assert orient(A, B, L[(i-1) % len(L)]) <= 0 and orient(A, B, L[(i+1) % len(L)]) <= 0, "Upper tangent invalid on L"
-    assert orient(A, B, R[(j-1) % len(R)]) <= 0 and orient(A, B, R[(j+1) % len(R)]) <= 0, "Upper tangent invalid on R"
+    assert orient(xs, ys, A, B, L[(i-1) % len(L)]) <= 0 and orient(xs, ys, A, B, L[(i+1) % len(L)]) <= 0, "Upper tangent invalid on L"
+    assert orient(xs, ys, A, B, R[(j-1) % len(R)]) <= 0 and orient(xs, ys, A, B, R[(j+1) % len(R)]) <= 0, "Upper tangent invalid on R"
 
-def ensure_lower_tangent_valid(L, R, i, j):
+def ensure_lower_tangent_valid(xs, ys, L, R, i, j):
     """Validate lower tangent (enable during debugging)."""
     A, B = L[i], R[j]
-    assert orient(A, B, L[(i-1) % len(L)]) >= 0 and orient(A, B, L[(i+1) % len(L)]) >= 0, "Lower tangent invalid on L"
-    assert orient(A, B, R[(j-1) % len(R)]) >= 0 and orient(A, B, R[(j+1) % len(R)]) >= 0, "Lower tangent invalid on R"
-
-def merge_hulls(L, R):
-    """Merge two CCW hulls using upper and lower tangents."""
+    assert orient(xs, ys, A, B, L[(i-1) % len(L)]) >= 0 and orient(xs, ys, A, B, L[(i+1) % len(L)]) >= 0, "Lower tangent invalid on L"
+    assert orient(xs, ys, A, B, R[(j-1) % len(R)]) >= 0 and orient(xs, ys, A, B, R[(j+1) % len(R)]) >= 0, "Lower tangent invalid on R"
+
+def merge_hulls(xs, ys, left, right):
+    """Merge two CCW hulls using upper and lower tangents.
+
+    Hulls travel as (hull, lmost, rmost) so neither side has to be scanned
+    for its extremes: the merged hull keeps the leftmost vertex of the left
+    hull and the rightmost vertex of the right hull, and their new indices
+    follow from the tangent positions.
+    """
+    L, lL, rL = left
+    R, lR, rR = right
     if not L or not R:
-        return L if L else R
+        return left if L else right
     
-    iu, ju = upper_tangent(L, R)
-    il, jl = lower_tangent(L, R)
+    iu, ju = upper_tangent(xs, ys, L, R, rL, lR)
+    il, jl = lower_tangent(xs, ys, L, R, rL, lR)
 
     # Enable while fixing; disable once stable
-    # ensure_upper_tangent_valid(L, R, iu, ju)
-    # ensure_lower_tangent_valid(L, R, il, jl)
-
-    H = []
-
-    # Walk L from iu -> il (inclusive) CCW
-    k = iu
-    H.append(L[k])
-    while k != il:
-        k = (k + 1) % len(L)
-        H.append(L[k])
-
-    # Walk R from jl -> ju (inclusive) CCW
-    k = jl
-    H.append(R[k])
-    while k != ju:
-        k = (k + 1) % len(R)
-        H.append(R[k])
-
-    return H
+    # ensure_upper_tangent_valid(xs, ys, L, R, iu, ju)
+    # ensure_lower_tangent_valid(xs, ys, L, R, il, jl)
 
-def convex_hull_dac(points_sorted, lo, hi):
-    """Divide and conquer convex hull on index range."""
-    n = hi - lo
-    if n <= 3:
-        return hull_base_case(points_sorted, lo, hi)
-
-    mid = (lo + hi) // 2
-    HL = convex_hull_dac(points_sorted, lo, mid)
-    HR = convex_hull_dac(points_sorted, mid, hi)
-    return merge_hulls(HL, HR)
+    # Outer arcs L[iu -> il] and R[jl -> ju] (inclusive, CCW), copied as
+    # slices; an arc that wraps past the end of its list takes two
+    if iu <= il:
+        H = L[iu:il+1]
+    else:
+        H = L[iu:] + L[:il+1]
+    # L's leftmost vertex lies on its arc, R's rightmost on R's arc: both are
+    # strict vertices of the merged hull, and the tangent walks stop at the
+    # outermost of any collinear vertices, so neither is cut off
+    lmost = (lL - iu) % len(L)
+    rmost = len(H) + (rR - jl) % len(R)
+    if jl <= ju:
+        H += R[jl:ju+1]
+    else:
+        H += R[jl:]
+        H += R[:ju+1]
+    return H, lmost, rmost
+
+def convex_hull_dac(xs, ys, lo, hi):
+    """Divide and conquer convex hull on index range, merged bottom-up.
+
+    Leaves are consecutive runs of up to 3 sorted points. Two neighbouring
+    hulls are merged as soon as they cover equally many leaves, which gives
+    the same balanced merge tree as the recursive split but keeps the work
+    depth-first (recently built hulls are merged while still hot) and needs
+    no recursion. The stack holds (level, hull) pairs, left to right.
+    """
+    stack = []
+    for hull in leaf_hulls(xs, ys, lo, hi):
+        level = 0
+        while stack and stack[-1][0] == level:
+            hull = merge_hulls(xs, ys, stack.pop()[1], hull)
+            level += 1
+        stack.append((level, hull))
+
+    if not stack:
+        return []
+    # Fold leftover partial levels (n is rarely 3 * 2**k), right to left
+    hull = stack.pop()[1]
+    while stack:
+        hull = merge_hulls(xs, ys, stack.pop()[1], hull)
+    return hull[0]
+
+def _parse_rows_slow(lines):
+    """Row-by-row CSV parse that reports the first bad line precisely."""
+    points = []
+    reader = csv.reader(lines)
+    for line_num, row in enumerate(reader, 1):
+        if len(row) != 2:
+            raise ValueError("Line {}: Expected format 'x,y', got '{}'".format(line_num, ','.join(row)))
+        try:
+            x, y = float(row[0]), float(row[1])
+        except ValueError as e:
+            raise ValueError("Line {}: Invalid coordinates '{}'".format(line_num, ','.join(row)))
+        if not (isfinite(x) and isfinite(y)):
+            raise ValueError("Line {}: Non-finite coordinates '{}'".format(line_num, ','.join(row)))
+        points.append((x, y))
+    return points
 
 def parse_input_file(filename):
     """Parse CSV file and return list of (x, y) tuples."""
-    points = []
     try:
         with open(filename, 'r') as f:
-            reader = csv.reader(f)
-            for line_num, row in enumerate(reader, 1):
-                if len(row) != 2:
-                    raise ValueError("Line {}: Expected format 'x,y', got '{}'".format(line_num, ','.join(row)))
-                try:
-                    x, y = float(row[0]), float(row[1])
-                    points.append((x, y))
-                except ValueError as e:
-                    raise ValueError("Line {}: Invalid coordinates '{}'".format(line_num, ','.join(row)))
+            lines = f.read().splitlines()
     except IOError as e:
         raise IOError("Could not read file '{}': {}".format(filename, e))
+
+    # Fast path: one read, plain split and float() per field. Anything it
+    # can't handle (quotes, wrong field count, bad numbers) goes through the
+    # csv module again to get the line-numbered error message.
+    try:
+        points = [(float(x), float(y)) for x, y in (line.split(',') for line in lines)]
+    except ValueError:
+        points = _parse_rows_slow(lines)
+    else:
+        # v * 0.0 is 0.0 for finite v and nan for inf/nan, so a single sum
+        # checks every coordinate; the slow path then names the bad line
+        if sum([x * 0.0 + y * 0.0 for x, y in points]) != 0.0:
+            points = _parse_rows_slow(lines)
     
     if len(points) < 3:
         raise ValueError("Need at least 3 points, got {}".format(len(points)))
     
     return points
 
-def convex_hull(points_xy):
-    """Compute convex hull and return indices in CCW order."""
-    # Keep original indices
-    pts = [Point(x, y, i) for i, (x, y) in enumerate(points_xy)]
+def _hull_of_slice(xy):
+    """Worker entry point: hull of one x-sorted slice, positions local to it."""
+    xs, ys = xy
+    return convex_hull_dac(xs, ys, 0, len(xs))
 
-    # Deduplicate exact duplicates (optional, recommended)
-    pts.sort(key=lambda t: (t.x, t.y, t.idx))
-    unique = []
+def convex_hull_parallel(xs, ys, jobs):
+    """Divide and conquer with the top-level split spread across processes.
+
+    The sorted points are cut into `jobs` contiguous slices whose hulls are
+    computed in a multiprocessing pool; the few remaining merges run here.
+    """
+    n = len(xs)
+    # More slices than points would leave some of them empty
+    jobs = min(jobs, n)
+    bounds = [n * k // jobs for k in range(jobs + 1)]
+    slices = [(xs[a:b], ys[a:b]) for a, b in zip(bounds, bounds[1:])]
+
+    pool = multiprocessing.Pool(jobs)
+    try:
+        parts = pool.map(_hull_of_slice, slices)
+    finally:
+        pool.close()
+        pool.join()
+
+    # Shift slice-local positions back to positions in xs/ys
+    hulls = [with_extremes([a + k for k in H]) for a, H in zip(bounds, parts)]
+    while len(hulls) > 1:
+        merged = [merge_hulls(xs, ys, hulls[k], hulls[k+1])
+                  for k in range(0, len(hulls) - 1, 2)]
+        if len(hulls) % 2:
+            merged.append(hulls[-1])
+        hulls = merged
+    return hulls[0][0]
+
+def akl_toussaint_filter(xs, ys):
+    """Return indices of points that may lie on the hull (ascending).
+
+    Akl-Toussaint heuristic: the extreme points in x, y, x+y and x-y span an
+    octagon inside the hull, and any point strictly inside that octagon can
+    be discarded. Points in an axis-aligned box inscribed in the octagon are
+    dropped with plain comparisons; the rest are tested edge by edge.
+    """
+    n = len(xs)
+    sums = [x + y for x, y in zip(xs, ys)]
+    diffs = [x - y for x, y in zip(xs, ys)]
+    # CCW order: left, lower-left, bottom, lower-right, right, upper-right,
+    # top, upper-left
+    ext = [xs.index(min(xs)), sums.index(min(sums)), ys.index(min(ys)),
+           diffs.index(max(diffs)), xs.index(max(xs)), sums.index(max(sums)),
+           ys.index(max(ys)), diffs.index(min(diffs))]
+    verts = []
+    for i in ext:
+        p = (xs[i], ys[i])
+        if not verts or (p != verts[-1] and p != verts[0]):
+            verts.append(p)
+    if len(verts) < 3:
+        return list(range(n))
+
+    # Edge k as a line nx*x + ny*y + c, positive strictly to its left. The
+    # slack below assumes those terms don't overflow; with coordinates that
+    # large, keep every point and leave it to the exact hull code
+    big = max(max(xs), -min(xs), max(ys), -min(ys))
+    if not isfinite(8.0 * big * big):
+        return list(range(n))
+    lines = []
+    for (ax, ay), (bx, by) in zip(verts, verts[1:] + verts[:1]):
+        nx, ny = ay - by, bx - ax
+        lines.append((nx, ny, -(nx * ax + ny * ay),
+                      FILTER_SLACK * (abs(nx) + abs(ny)) * big))
+
+    def inside(x, y):
+        for nx, ny, c, m in lines:
+            # Written so that a nan counts as "not inside"
+            if not (nx * x + ny * y + c > m):
+                return False
+        return True
+
+    # Box from the inner coordinates of the octagon's vertices, used only
+    # if all four corners check out as inside
+    left = max(xs[i] for i in (ext[7], ext[0], ext[1]))
+    right = min(xs[i] for i in (ext[3], ext[4], ext[5]))
+    bottom = max(ys[i] for i in (ext[1], ext[2], ext[3]))
+    top = min(ys[i] for i in (ext[5], ext[6], ext[7]))
+    if left <= right and bottom <= top and all(
+            inside(x, y) for x in (left, right) for y in (bottom, top)):
+        rest = [i for i in range(n)
+                if not (left <= xs[i] <= right and bottom <= ys[i] <= top)]
+    else:
+        rest = list(range(n))
+
+    hidden = rest
+    for nx, ny, c, m in lines:
+        hidden = [i for i in hidden if nx * xs[i] + ny * ys[i] + c > m]
+    hidden = set(hidden)
+    return [i for i in rest if i not in hidden]
+
+def convex_hull(points_xy, jobs=1):
+    """Compute convex hull and return indices in CCW order from the leftmost point.
+
+    With jobs > 1, inputs of at least PARALLEL_MIN_POINTS points are split
+    across that many worker processes.
+    """
+    pts = [(float(x), float(y)) for x, y in points_xy]
+    if not pts:
+        return []
+
+    # Drop points that are certainly interior before sorting
+    candidates = akl_toussaint_filter([p[0] for p in pts], [p[1] for p in pts])
+
+    # Sort once by (x, then y); the sort is stable so ties keep input order.
+    # pts.__getitem__ as the key keeps the key calls in C (no lambda frame)
+    order = sorted(candidates, key=pts.__getitem__)
+
+    # Points are kept as parallel lists (xs, ys) in sorted order; a point's
+    # position there is its id, and perm maps it back to its original index.
+    # Exact duplicates are dropped, keeping the lowest original index.
+    xs, ys, perm = [], [], []
     last = None
-    for p in pts:
-        if last is None or p.x != last.x or p.y != last.y:
-            unique.append(p)
+    for i in order:
+        p = pts[i]
+        if p != last:
+            xs.append(p[0])
+            ys.append(p[1])
+            perm.append(i)
             last = p
-    pts = unique
 
-    # Sort once by (x, then y)
-    pts.sort(key=lambda t: (t.x, t.y))
+    if jobs > 1 and len(xs) >= PARALLEL_MIN_POINTS:
+        H = convex_hull_parallel(xs, ys, jobs)
+    else:
+        H = convex_hull_dac(xs, ys, 0, len(xs))
 
-    H = convex_hull_dac(pts, 0, len(pts))
+    # Start the cycle at the leftmost vertex, so the output does not depend
+    # on the order the merges ran in (sequential stack vs. -j levels)
+    k = index_leftmost(H)
+    H = H[k:] + H[:k]
 
     # Return indices in hull cycle order (CCW)
-    return [p.idx for p in H]
+    return list(map(perm.__getitem__, H))
 
 def write_hull_indices_to_file(hull_indices, filename):
     """Write hull indices to file, one per line."""
     try:
         with open(filename, 'w') as f:
-            for i, idx in enumerate(hull_indices):
-                if i > 0:
-                    f.write('\n')
-                f.write(str(idx))
+            f.write('\n'.join(map(str, hull_indices)))
     except IOError as e:
         raise IOError("Could not write to file '{}': {}".format(filename, e))
 
@@ -244,19 +531,24 @@ def main():
         parser = argparse.ArgumentParser(description='Convex Hull using Divide and Conquer')
         parser.add_argument('input_file', help='Input CSV file with x,y coordinates')
         parser.add_argument('-o', '--output', default='output.txt', help='Output file for hull indices')
+        parser.add_argument('-j', '--jobs', type=int, default=1, help='Worker processes for large inputs')
         args = parser.parse_args()
         input_file = args.input_file
         output_file = args.output
+        jobs = args.jobs
     else:
         # Python 2.6 and earlier with optparse
         parser = optparse.OptionParser(description='Convex Hull using Divide and Conquer')
         parser.add_option('-o', '--output', dest='output', default='output.txt', 
                          help='Output file for hull indices')
+        parser.add_option('-j', '--jobs', dest='jobs', type='int', default=1,
+                         help='Worker processes for large inputs')
         (options, args) = parser.parse_args()
         if len(args) != 1:
             parser.error("Expected exactly one input file")
         input_file = args[0]
         output_file = options.output
+        jobs = options.jobs
     
     try:
         # Parse input
@@ -265,7 +557,7 @@ def main():
         
         # Compute convex hull
         print("Computing convex hull...")
-        hull_indices = convex_hull(points)
+        hull_indices = convex_hull(points, jobs)
         
         # Write output
         write_hull_indices_to_file(hull_indices, output_file)
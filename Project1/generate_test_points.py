@@ -5,29 +5,34 @@ Script to generate 50 additional random points for testing the convex hull algor
 
 import random
 import csv
+from operator import itemgetter
 
-def generate_random_points(num_points=50, x_range=(0, 10), y_range=(0, 10)):
-    """Generate random points within specified ranges."""
-    points = []
-    for _ in range(num_points):
-        x = random.uniform(x_range[0], x_range[1])
-        y = random.uniform(y_range[0], y_range[1])
-        points.append((x, y))
+def generate_random_points(num_points=50, x_range=(0, 10), y_range=(0, 10), rng=random):
+    """Generate random points within specified ranges.
+
+    rng is anything with a uniform() method (the random module or a
+    random.Random instance); x and y are drawn alternately, as before.
+    """
+    uniform = rng.uniform
+    (x0, x1), (y0, y1) = x_range, y_range
+    points = [(uniform(x0, x1), uniform(y0, y1)) for _ in range(num_points)]
     
     # Sort by x-coordinate to maintain the expected format
-    points.sort(key=lambda p: p[0])
+    points.sort(key=itemgetter(0))
     return points
 
 def append_points_to_csv(filename, new_points):
     """Append new points to the existing CSV file."""
     with open(filename, 'a') as file:
-        for x, y in new_points:
-            file.write("{},{}\n".format(x, y))
+        file.write(''.join("{},{}\n".format(x, y) for x, y in new_points))
 
 def main():
+    # Seeded generator for reproducible results
+    rng = random.Random(42)
+
     # Generate 50 random points
     print("Generating 50 random points...")
-    new_points = generate_random_points(50, x_range=(0, 10), y_range=(0, 10))
+    new_points = generate_random_points(50, x_range=(0, 10), y_range=(0, 10), rng=rng)
     
     # Append to input.csv
     print("Appending points to input.csv...")
@@ -39,6 +44,4 @@ def main():
     print("  Y: {:.3f} to {:.3f}".format(min(p[1] for p in new_points), max(p[1] for p in new_points)))
 
 if __name__ == "__main__":
-    # Set random seed for reproducible results
-    random.seed(42)
     main()
@@ -1,9 +1,11 @@
-class Point:
+class Point(object):
     """
     Represents a 2D point with x and y coordinates.
     Used for convex hull calculations in the divide and conquer algorithm.
     """
     
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
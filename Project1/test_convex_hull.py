@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the divide and conquer convex hull.
+Run with: python3 test_convex_hull.py
+"""
+
+import math
+import random
+import unittest
+from fractions import Fraction
+
+import convex_hull as ch
+from convex_hull import akl_toussaint_filter, convex_hull
+
+
+def cross(a, b, c):
+    """Exact orientation value of a->b->c (positive if CCW)."""
+    ax, ay, bx, by, cx, cy = [Fraction(v) for v in a + b + c]
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def reference_hull(pts):
+    """Exact strict-hull vertex set by monotone chain (test oracle only)."""
+    P = sorted(set(pts))
+    if len(P) < 3:
+        return set(P)
+    lower, upper = [], []
+    for p in P:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    for p in reversed(P):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return set(lower[:-1] + upper[:-1])
+
+
+class ConvexHullTest(unittest.TestCase):
+
+    def assertIsHull(self, pts, H):
+        """H is the CCW cycle of strict hull vertices, as original indices."""
+        self.assertEqual(len(H), len(set(H)))
+        ring = [pts[i] for i in H]
+        for k in range(len(ring)):
+            a, b = ring[k], ring[(k + 1) % len(ring)]
+            for p in pts:
+                self.assertGreaterEqual(cross(a, b, p), 0)
+        self.assertEqual(reference_hull(pts), set(ring))
+
+    def test_large_coordinates(self):
+        # Cross products overflow to inf/nan at these scales
+        for scale in (1e155, 1e200, 1e300):
+            rnd = random.Random(1)
+            pts = [(rnd.uniform(-1, 1) * scale, rnd.uniform(-1, 1) * scale)
+                   for _ in range(300)]
+            self.assertIsHull(pts, convex_hull(pts))
+
+    def test_collinear_inputs(self):
+        for n in (2, 3, 7, 8, 100):
+            for pts in ([(i, i) for i in range(n)],
+                        [(0, i) for i in range(n)],
+                        [(i, 0) for i in range(n)]):
+                H = convex_hull(pts)
+                self.assertEqual(sorted(H), [0, n - 1])
+
+    def test_integer_grid(self):
+        rnd = random.Random(3)
+        pts = [(rnd.randint(0, 30), rnd.randint(0, 30)) for _ in range(5000)]
+        self.assertIsHull(pts, convex_hull(pts))
+        pts = [(x, y) for x in range(12) for y in range(3)]
+        self.assertIsHull(pts, convex_hull(pts))
+
+    def test_parallel_matches_sequential(self):
+        n = 6000
+        pts = [(math.cos(2 * math.pi * k / n), math.sin(2 * math.pi * k / n))
+               for k in range(n)]
+        random.Random(5).shuffle(pts)
+        saved = ch.PARALLEL_MIN_POINTS
+        ch.PARALLEL_MIN_POINTS = 1000
+        try:
+            for jobs in (2, 3):
+                self.assertEqual(convex_hull(pts), convex_hull(pts, jobs=jobs))
+        finally:
+            ch.PARALLEL_MIN_POINTS = saved
+
+    def test_parallel_more_jobs_than_points(self):
+        xs, ys = [0.0, 1.0, 2.0, 3.0, 4.0], [0.0, 1.0, -1.0, 2.0, 0.0]
+        self.assertEqual(sorted(ch.convex_hull_dac(xs, ys, 0, 5)),
+                         sorted(ch.convex_hull_parallel(xs, ys, 8)))
+
+    def test_filter_keeps_hull_vertices_at_large_scale(self):
+        rnd = random.Random(1)
+        pts = [(rnd.uniform(-1, 1) * 1e155, rnd.uniform(-1, 1) * 1e155)
+               for _ in range(300)]
+        kept = set(akl_toussaint_filter([p[0] for p in pts],
+                                        [p[1] for p in pts]))
+        hull = reference_hull(pts)
+        self.assertEqual([], [i for i, p in enumerate(pts)
+                              if p in hull and i not in kept])
+
+
+if __name__ == "__main__":
+    unittest.main()